@@ -2,15 +2,28 @@ import os
 import time
 import signal
 import threading
-import queue
 import argparse
-import select
+import selectors
 import gc
+import socket
+import fcntl
+import ctypes
+import errno
 import subprocess
 import traceback
 import shutil
+import wave
 from pathlib import Path
 import logging
+import numpy as np
+import soundfile as sf
+
+try:
+    from jeepney import DBusAddress, new_method_call
+    from jeepney.wrappers import unwrap_msg
+    from jeepney.io.blocking import open_dbus_connection
+except ImportError:
+    open_dbus_connection = None
 
 # ==============================================================================
 # CONFIGURATION & MODEL SELECTION
@@ -25,44 +38,152 @@ AUDIO_DIR = ZRAM_MOUNT if ZRAM_MOUNT.is_dir() else Path("/tmp/dusky_stt_audio")
 AUDIO_DIR.mkdir(parents=True, exist_ok=True)
 
 FIFO_PATH = Path("/tmp/dusky_stt.fifo")
+SOCKET_PATH = Path("/tmp/dusky_stt.sock")
+WAV_SOCKET_PATH = Path("/tmp/dusky_stt_wav.sock")
 PID_FILE = Path("/tmp/dusky_stt.pid")
 READY_FILE = Path("/tmp/dusky_stt.ready")
 
 IDLE_TIMEOUT = 10.0  
+# A preload happens as recording starts, so its model waits this long for the first request before unloading
+PRELOAD_GRACE = 120.0
 QUEUE_SIZE = 5
 
+SAMPLE_RATE = 16000
+MAX_SAMPLES = SAMPLE_RATE * 30
+WARMUP_SAMPLES = SAMPLE_RATE * 10
+MAX_WAV_BYTES = 64 * 1024 * 1024
+ENCODER_FILE_PREFIX = "encoder-model"
+
+# TensorRT engines are built once and cached; INT8 only kicks in when a calibration table exists
+TRT_CACHE_DIR = Path.home() / ".cache" / "dusky_stt" / "trt"
+TRT_CALIBRATION_TABLE = TRT_CACHE_DIR / "parakeet_calib.flatbuffers"
+# Longest input the encoder engine's shape profile accepts; longer clips are split into pieces under it
+TRT_MAX_SAMPLES = SAMPLE_RATE * 120
+
+# Quiet by default; DUSKY_STT_LOG_LEVEL=INFO (or DEBUG) brings back per-request logging
+LOG_LEVEL_ENV = (os.environ.get("DUSKY_STT_LOG_LEVEL") or "WARNING").upper()
 logger = logging.getLogger("dusky_stt")
-logger.setLevel(logging.INFO)
+logger.setLevel(logging.getLevelNamesMapping().get(LOG_LEVEL_ENV, logging.WARNING))
 c_handler = logging.StreamHandler()
 c_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 logger.addHandler(c_handler)
+if LOG_LEVEL_ENV not in logging.getLevelNamesMapping():
+    # A typo must not stop the daemon from starting (the trigger would just time out on the ready file)
+    logger.warning("Unknown DUSKY_STT_LOG_LEVEL %r, using WARNING", LOG_LEVEL_ENV)
 
 def custom_excepthook(args):
-    logger.critical(f"UNCAUGHT EXCEPTION: {args.exc_value}")
+    logger.critical("UNCAUGHT EXCEPTION: %s", args.exc_value)
     traceback.print_tb(args.exc_traceback)
 
 threading.excepthook = custom_excepthook
 
+NOTIFY_APP = "Parakeet STT"
+NOTIFY_SEND = shutil.which("notify-send")
+NOTIFY_TIMEOUT_MS = 3000
+_dbus_conn = None
+
+def notify_dbus(title, message, critical):
+    # Talks to org.freedesktop.Notifications over one long-lived session bus connection (no fork/exec)
+    global _dbus_conn
+    if _dbus_conn is None:
+        _dbus_conn = open_dbus_connection(bus='SESSION')
+    addr = DBusAddress('/org/freedesktop/Notifications', bus_name='org.freedesktop.Notifications',
+                       interface='org.freedesktop.Notifications')
+    hints = {'urgency': ('y', 2 if critical else 1)}
+    msg = new_method_call(addr, 'Notify', 'susssasa{sv}i',
+                          (NOTIFY_APP, 0, '', title, message, [], hints, NOTIFY_TIMEOUT_MS))
+    try:
+        reply = _dbus_conn.send_and_get_reply(msg, timeout=1.0)
+    except Exception:
+        _dbus_conn.close()
+        _dbus_conn = None
+        raise
+    # Error replies (e.g. ServiceUnknown with no notification daemon) come back as messages, not raises
+    unwrap_msg(reply)
+
+# Children are always spawned by absolute path and never with preexec_fn, which keeps CPython on its
+# vfork()/posix_spawn() fast path instead of fork()ing the ORT/CUDA-heavy daemon.
 def notify(title, message, critical=False):
-    if not shutil.which("notify-send"):
-        logger.error(f"notify-send missing. Cannot display: {title} - {message}")
+    if open_dbus_connection is not None:
+        try:
+            notify_dbus(title, message, critical)
+            return
+        except Exception as e:
+            logger.warning("D-Bus notify failed, falling back to notify-send: %s", e)
+    if not NOTIFY_SEND:
+        logger.error("notify-send missing. Cannot display: %s - %s", title, message)
         return
-    cmd = ["notify-send", "-a", "Parakeet STT", "-t", "3000"]
+    cmd = [NOTIFY_SEND, "-a", NOTIFY_APP, "-t", str(NOTIFY_TIMEOUT_MS)]
     if critical:
         cmd.extend(["-u", "critical"])
     cmd.extend([title, message])
     try:
         subprocess.run(cmd, check=False)
     except Exception as e:
-        logger.error(f"Failed to execute notify-send: {e}")
+        logger.error("Failed to execute notify-send: %s", e)
+
+def open_pcm16_wav(path):
+    # int16 memmap over the sample data of a 16 kHz mono PCM16 wav (the recorder's format), else None
+    with open(path, 'rb') as f:
+        try:
+            w = wave.open(f)
+        except (wave.Error, EOFError):
+            return None
+        if w.getsampwidth() != 2 or w.getnchannels() != 1 or w.getframerate() != SAMPLE_RATE:
+            return None
+        offset = f.tell()
+        available = (os.fstat(f.fileno()).st_size - offset) // 2
+        # A recorder killed mid-write can leave a zero/placeholder length in the header
+        n = w.getnframes()
+        if not 0 < n <= available:
+            n = available
+    if n <= 0:
+        return np.empty(0, dtype=np.int16)
+    return np.memmap(path, dtype='<i2', mode='r', offset=offset, shape=(n,))
+
+def encoder_on_trt(model):
+    # What the encoder session actually runs on; get_available_providers() lists TRT even without its libraries
+    return model.asr._encoder.get_providers()[0] == 'TensorrtExecutionProvider'
 
 # ==============================================================================
 # HARDWARE ENFORCER
 # ==============================================================================
 import onnxruntime as rt
 
+# Each session keeps its own CUDA arena, so an idle unload really returns it to the driver. Power-of-two
+# growth plus the warm-up pass sizes it once; later runs in a burst recycle it instead of cudaMalloc-ing.
+# (A shared env allocator could be pre-sized, but it outlives the sessions and would pin VRAM while idle.)
+CUDA_MEM_LIMIT = 6 * 1024 * 1024 * 1024
+# Set once a session asked for TRT and ORT quietly fell back to CUDA, so later loads skip the attempt
+_trt_unusable = False
+
+# The memory inference actually touches (ORT's copy of the weights, warmed-up buffers) is pinned while the
+# model is loaded, so zram/page-cache pressure can't evict it mid-burst. The .onnx files themselves are
+# only read once at load, so pinning their page cache would buy nothing.
+MCL_CURRENT = 1
+MCL_ONFAULT = 4
+_mlock_warned = False
+_libc = ctypes.CDLL(None, use_errno=True)
+
+def lock_memory():
+    # MCL_ONFAULT locks resident pages now and the rest only if touched, so reserved address space stays free
+    global _mlock_warned
+    if _libc.mlockall(MCL_CURRENT | MCL_ONFAULT) == 0:
+        return
+    err = ctypes.get_errno()
+    if not _mlock_warned:
+        logger.warning(
+            "mlockall failed (%s); raise RLIMIT_MEMLOCK to pin the model. Continuing unpinned.",
+            errno.errorcode.get(err, err),
+        )
+        _mlock_warned = True
+
+def unlock_memory():
+    _libc.munlockall()
+
 class PatchedInferenceSession(rt.InferenceSession):
     def __init__(self, path_or_bytes, sess_options=None, providers=None, **kwargs):
+        global _trt_unusable
         if sess_options is None:
             sess_options = rt.SessionOptions()
         
@@ -70,19 +191,40 @@ class PatchedInferenceSession(rt.InferenceSession):
         p_opts = []
         available_set = set(rt.get_available_providers())
         is_gpu = False
+        arena_device = 'cpu:0'
+        is_encoder = isinstance(path_or_bytes, (str, Path)) and Path(path_or_bytes).name.startswith(ENCODER_FILE_PREFIX)
+        requested_opts = dict(zip(providers or [], kwargs.pop('provider_options', None) or []))
 
         if 'CUDAExecutionProvider' in available_set:
             is_gpu = True
+            if 'TensorrtExecutionProvider' in available_set and not _trt_unusable:
+                TRT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                trt_opts = {
+                    'device_id': 0,
+                    'trt_fp16_enable': True,
+                    'trt_engine_cache_enable': True,
+                    'trt_engine_cache_path': str(TRT_CACHE_DIR),
+                    'trt_max_workspace_size': 1 << 30,
+                }
+                if is_encoder and TRT_CALIBRATION_TABLE.is_file():
+                    trt_opts['trt_int8_enable'] = True
+                    trt_opts['trt_int8_calibration_table_name'] = TRT_CALIBRATION_TABLE.name
+                # onnx_asr supplies the shape profiles and disables fp16 for its preprocessor
+                trt_opts.update(requested_opts.get('TensorrtExecutionProvider', {}))
+                p_names.append('TensorrtExecutionProvider')
+                p_opts.append(trt_opts)
             p_names.append('CUDAExecutionProvider')
             p_opts.append({
                 'device_id': 0,
-                'arena_extend_strategy': 'kSameAsRequested',
-                'gpu_mem_limit': 6 * 1024 * 1024 * 1024,
+                'arena_extend_strategy': 'kNextPowerOfTwo',
+                'gpu_mem_limit': CUDA_MEM_LIMIT,
                 'cudnn_conv_algo_search': 'HEURISTIC',
                 'do_copy_in_default_stream': True,
             })
+            arena_device = None
         elif 'MIGraphXExecutionProvider' in available_set:
             is_gpu = True
+            arena_device = None
             p_names.append('MIGraphXExecutionProvider')
             p_opts.append({
                 'device_id': 0,
@@ -96,6 +238,7 @@ class PatchedInferenceSession(rt.InferenceSession):
                 'gpu_mem_limit': 3 * 1024 * 1024 * 1024,
                 'do_copy_in_default_stream': True,
             })
+            arena_device = 'gpu:0'
 
         p_names.append('CPUExecutionProvider')
         p_opts.append({})
@@ -103,53 +246,173 @@ class PatchedInferenceSession(rt.InferenceSession):
         if is_gpu:
             sess_options.enable_mem_pattern = False
             sess_options.enable_cpu_mem_arena = False
+            # Weights bypass the arena so shrinkage can actually hand activation memory back
+            sess_options.add_session_config_entry("session.use_device_allocator_for_initializers", "1")
         else:
             sess_options.enable_mem_pattern = True
             sess_options.enable_cpu_mem_arena = True
 
         sess_options.graph_optimization_level = rt.GraphOptimizationLevel.ORT_ENABLE_ALL
-        kwargs.pop('provider_options', None)
         
         super().__init__(path_or_bytes, sess_options, providers=p_names, provider_options=p_opts, **kwargs)
 
+        if 'TensorrtExecutionProvider' in p_names and self.get_providers()[0] != 'TensorrtExecutionProvider':
+            logger.warning("TensorRT provider failed to load; running on %s", self.get_providers()[0])
+            _trt_unusable = True
+
+        # Encoder runs carry the arena shrinkage; decoder/preprocessor runs are tiny and per-token.
+        # Only ROCm's capped arena shrinks per run; the CUDA arena stays grown until the session is dropped.
+        self._run_options = None
+        if is_encoder and arena_device:
+            self._run_options = rt.RunOptions()
+            self._run_options.add_run_config_entry("memory.enable_memory_arena_shrinkage", arena_device)
+
+    def run(self, output_names, input_feed, run_options=None):
+        if run_options is None:
+            run_options = self._run_options
+        return super().run(output_names, input_feed, run_options)
+
 rt.InferenceSession = PatchedInferenceSession
 import onnx_asr 
+from onnx_asr.onnx import TensorRtOptions
+
+# onnx_asr's profile stops at 30 s, which a long FIFO dictation overruns
+TensorRtOptions.profile_max_shapes = {
+    **TensorRtOptions.profile_max_shapes, "waveform_len_ms": TRT_MAX_SAMPLES * 1000 // SAMPLE_RATE
+}
 
 # ==============================================================================
-# THREAD: FIFO READER
+# EVENT SOURCES
 # ==============================================================================
-class FifoReader(threading.Thread):
-    def __init__(self, path_queue, fifo_path):
-        super().__init__(name="FIFO")
-        self.path_queue = path_queue
-        self.fifo_path = fifo_path
-        self.active = True
-        self.daemon = True
-
-    def run(self):
-        if not self.fifo_path.exists(): os.mkfifo(self.fifo_path)
-        fd = os.open(self.fifo_path, os.O_RDWR | os.O_NONBLOCK)
-        poll = select.poll()
-        poll.register(fd, select.POLLIN)
-
-        while self.active:
-            if not poll.poll(500): continue
+def open_fifo(fifo_path):
+    if fifo_path.exists() and not fifo_path.is_fifo(): fifo_path.unlink()
+    if not fifo_path.exists(): os.mkfifo(fifo_path)
+    return os.open(fifo_path, os.O_RDWR | os.O_NONBLOCK)
+
+def read_fifo_paths(fd):
+    parts = []
+    while True:
+        try:
+            chunk = os.read(fd, 4096)
+            if not chunk: break
+            parts.append(chunk)
+        except BlockingIOError: break
+
+    paths = []
+    for path_str in b"".join(parts).decode('utf-8', errors='ignore').splitlines():
+        clean_path = path_str.strip()
+        if clean_path:
+            paths.append(clean_path)
+    return paths
+
+def open_unix_listener(socket_path):
+    socket_path.unlink(missing_ok=True)
+    srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    srv.bind(str(socket_path))
+    os.chmod(socket_path, 0o600)
+    srv.listen(QUEUE_SIZE)
+    srv.setblocking(False)
+    return srv
+
+# PCM socket: <u32 little-endian sample_count><sample_count x f32 little-endian, mono 16 kHz>,
+# any number per connection. Samples are received straight into the array handed to the model.
+class PcmStream:
+    # Non-blocking reader for one accepted connection; the selector calls feed() whenever it is readable,
+    # so a slow or idle client never holds up the FIFO, other sockets or the idle timer
+    def __init__(self, conn):
+        self.conn = conn
+        self.header = bytearray(4)
+        self.samples = None
+        self.view = memoryview(self.header)
+
+    def feed(self):
+        # Returns (frames completed by this read, whether the connection is still open)
+        frames = []
+        while True:
             try:
-                data = b""
-                while True:
-                    try:
-                        chunk = os.read(fd, 4096)
-                        if not chunk: break
-                        data += chunk
-                    except BlockingIOError: break
-                
-                if data:
-                    for path_str in data.decode('utf-8', errors='ignore').splitlines():
-                        clean_path = path_str.strip()
-                        if clean_path:
-                            self.path_queue.put(clean_path)
-            except OSError: time.sleep(1)
-        os.close(fd)
+                got = self.conn.recv_into(self.view)
+            except BlockingIOError:
+                return frames, True
+            except OSError as e:
+                logger.error("PCM Socket Error: %s", e)
+                got = 0
+            if not got:
+                if self.samples is not None or len(self.view) < len(self.header):
+                    logger.warning("PCM client closed mid-frame; dropping the partial frame")
+                return frames, False
+            self.view = self.view[got:]
+            if self.view:
+                continue
+            if self.samples is None:
+                count = int.from_bytes(self.header, 'little')
+                if not 0 < count <= MAX_SAMPLES:
+                    logger.error("Rejected PCM frame of %d samples (max %d)", count, MAX_SAMPLES)
+                    return frames, False
+                self.samples = np.empty(count, dtype=np.float32)
+                self.view = memoryview(self.samples).cast('B')
+            else:
+                frames.append(self.samples)
+                self.samples = None
+                self.view = memoryview(self.header)
+
+    def close(self):
+        self.conn.close()
+
+# WAV socket: one wav file per connection, streamed until the client shuts down its end (at most
+# MAX_WAV_BYTES). The trigger's --stream mode pipes the recorder straight in, so no file is ever written;
+# a placeholder length in the streamed header is handled by open_pcm16_wav.
+# The body is spliced socket -> pipe -> memfd in-kernel as it arrives and decoded via /proc/self/fd/N.
+class WavStream:
+    # Non-blocking like PcmStream; feed() returns (memfd once the whole file is in, whether to keep reading)
+    def __init__(self, conn):
+        self.conn = conn
+        self.size = 0
+        self.memfd = None
+        self.pipe = None
+        self.chunk = 1 << 16
+
+    def feed(self):
+        try:
+            if self.memfd is None:
+                self.memfd = os.memfd_create("dusky_stt_wav", os.MFD_CLOEXEC)
+                # splice() needs a pipe on one side, so the kernel-side copy bounces through one
+                self.pipe = os.pipe()
+                try: self.chunk = fcntl.fcntl(self.pipe[1], fcntl.F_SETPIPE_SZ, 1 << 20)
+                except OSError: pass
+
+            r, w = self.pipe
+            while moved := os.splice(self.conn.fileno(), w, self.chunk, flags=os.SPLICE_F_NONBLOCK):
+                self.size += moved
+                if self.size > MAX_WAV_BYTES:
+                    raise ValueError(f"Rejected WAV over {MAX_WAV_BYTES} bytes")
+                while moved:
+                    moved -= os.splice(r, self.memfd, moved)
+        except BlockingIOError:
+            return None, True
+        except (OSError, ValueError) as e:
+            logger.error("WAV Socket Error: %s", e)
+            self.release()
+            return None, False
+
+        if not self.size:
+            self.release()
+            return None, False
+        memfd, self.memfd = self.memfd, None
+        self.release()
+        return memfd, False
+
+    def close(self):
+        self.release()
+        self.conn.close()
+
+    def release(self):
+        # Drops the pipe and any unfinished memfd; a completed memfd has already been handed to the caller
+        for fd in (self.pipe or ()):
+            os.close(fd)
+        self.pipe = None
+        if self.memfd is not None:
+            os.close(self.memfd)
+            self.memfd = None
 
 # ==============================================================================
 # DAEMON CORE
@@ -157,78 +420,257 @@ class FifoReader(threading.Thread):
 class DuskySTTDaemon:
     def __init__(self):
         self.running = True
-        logger.info(f"Dusky STT Daemon {VERSION} Initializing...")
-        self.path_queue = queue.Queue(maxsize=QUEUE_SIZE)
-        self.fifo_reader = FifoReader(self.path_queue, FIFO_PATH)
+        logger.info("Dusky STT Daemon %s Initializing...", VERSION)
+        # Resolved once; every transcription would otherwise re-walk $PATH
+        self._wl_copy = shutil.which("wl-copy")
+        if not self._wl_copy:
+            logger.critical("wl-copy not found in PATH. Install wl-clipboard.")
+            raise SystemExit(1)
+        # Refcounting frees everything per-request; a cyclic pass landing mid-Run() only steals CPU
+        # from ORT's threads. Cycles from model teardown are collected explicitly in unload_model.
+        gc.disable()
         self.model = None
         self.last_used = 0
+        self._preloaded_at = 0
+        self._warmed_up = False
+        self._trt_encoder = False
+        self._in_buf = np.empty((QUEUE_SIZE, MAX_SAMPLES), dtype=np.float32)
 
     def get_model(self):
-        self.last_used = time.time()
         if self.model is None:
-            logger.info(f"Loading {STT_MODEL_NAME} (Quantization: {QUANTIZATION}) into VRAM...")
-            self.model = onnx_asr.load_model(STT_MODEL_NAME, quantization=QUANTIZATION)
+            logger.info("Loading %s (Quantization: %s) into VRAM...", STT_MODEL_NAME, QUANTIZATION)
+            # Conv-based STFT keeps log-mel extraction on the GPU; op.STFT has no CUDA/TRT kernel and bounces to CPU
+            self.model = onnx_asr.load_model(
+                STT_MODEL_NAME, quantization=QUANTIZATION, preprocessor_config={'use_conv_preprocessors': True}
+            )
+            # Reduced-precision TRT engines can over-report encoder lengths; onnx_asr clamps only when told
+            self._trt_encoder = encoder_on_trt(self.model)
+            self.model.asr.use_low_precision = self._trt_encoder
+            if not self._warmed_up:
+                # One silent pass grows the arena and picks conv algos before a real utterance pays for it
+                logger.info("Warming up inference path...")
+                next(self.model.asr.recognize_batch(
+                    np.zeros((1, WARMUP_SAMPLES), dtype=np.float32), np.array([WARMUP_SAMPLES], dtype=np.int64)
+                ))
+                self._warmed_up = True
+            lock_memory()
         return self.model
 
+    def idle_deadline(self):
+        # IDLE_TIMEOUT after the last request; a fresh preload gets PRELOAD_GRACE to see its first one, so
+        # one nobody follows up on (--restart, a rejected --stdin, an abandoned recording) still unloads
+        if self.last_used > self._preloaded_at:
+            return self.last_used + IDLE_TIMEOUT
+        return self._preloaded_at + PRELOAD_GRACE
+
+    def arm_idle_timer(self, timer_fd):
+        # One-shot at the unload deadline, disarmed while nothing is loaded: an idle daemon never wakes
+        delay = max(self.idle_deadline() - time.time(), 0.001) if self.model else 0
+        os.timerfd_settime(timer_fd, initial=delay)
+
     def check_idle(self):
-        if self.model and (time.time() - self.last_used > IDLE_TIMEOUT):
-            logger.info(f"Idle timeout ({IDLE_TIMEOUT}s). Unloading model to free VRAM.")
-            del self.model
-            self.model = None
-            gc.collect()
-
-    def transcribe(self, filepath):
-        logger.info(f"Transcribing: {filepath}")
-        
+        if self.model and time.time() > self.idle_deadline():
+            logger.info("Idle timeout (%ss). Unloading model to free VRAM.", IDLE_TIMEOUT)
+            self.unload_model()
+
+    def unload_model(self):
+        # Every path that drops the model: sessions go, their pages are unpinned, then the teardown cycles
+        # are collected here because automatic collection is off
+        self.model = None
+        unlock_memory()
+        gc.collect()
+
+    def audio_target(self, row, n):
+        # Clips up to MAX_SAMPLES share the fixed batch buffer; anything longer gets its own array and a solo
+        # run, so one long dictation neither grows the buffer for good nor pads the short clips next to it
+        if n <= MAX_SAMPLES:
+            return self._in_buf[row, :n]
+        return np.empty(n, dtype=np.float32)
+
+    def load_audio(self, item, row):
+        # Returns the decoded float32 samples; None means "let onnx_asr decode this file itself"
+        if isinstance(item, np.ndarray):
+            out = self.audio_target(row, len(item))
+            out[:] = item
+            return out
+        pcm = open_pcm16_wav(item)
+        if pcm is not None:
+            return np.multiply(pcm, np.float32(1.0 / 32768), out=self.audio_target(row, len(pcm)), dtype=np.float32)
+        with sf.SoundFile(item) as f:
+            if f.samplerate != SAMPLE_RATE or f.channels != 1:
+                return None
+            return f.read(f.frames, dtype='float32', out=self.audio_target(row, f.frames))
+
+    def transcribe(self, items):
+        # items are wav paths from the FIFO and/or float32 PCM arrays from the socket, in arrival order
         try:
-            model = self.get_model()
-            res = model.recognize(filepath)
-            text = (res[0] if isinstance(res, list) else res).strip()
-            
-            del res
-            gc.collect()
-            
-        except Exception as e:
-            logger.error(f"Inference Error: {e}")
-            self.model = None 
-            notify("Transcription Failed", str(e), critical=True)
-            return
+            texts = self.infer(items)
+        finally:
+            # Idle countdown runs from the end of every request, empty and failed ones included
+            self.last_used = time.time()
 
-        if not text:
-            logger.warning("No speech detected.")
-            return
-            
-        logger.info(f"Success: {text[:50]}...")
-        
+        # Batching is an encoder detail: each clip still gets its own clipboard copy and notification
+        for text in texts:
+            if text is None:
+                continue
+            text = text.strip()
+            if not text:
+                logger.warning("No speech detected.")
+                continue
+
+            logger.info("Success: %.50s...", text)
+
+            try:
+                subprocess.run([self._wl_copy], input=text.encode('utf-8'), check=True)
+                notify("Transcription Complete", text)
+            except Exception as e:
+                logger.error("Wayland Output Error: %s", e)
+                notify("Output Failed (wl-copy)", str(e), critical=True)
+
+    def infer(self, items):
+        # One text per item; None where there was nothing to transcribe or it failed
+        texts = [None] * len(items)
+        batch, lens, solo, fallback = [], [], [], []
+        for i, item in enumerate(items):
+            if isinstance(item, np.ndarray):
+                logger.info("Transcribing: %d samples (socket)", len(item))
+            else:
+                logger.info("Transcribing: %s", item)
+            try:
+                audio = self.load_audio(item, len(batch))
+            except Exception as e:
+                logger.error("Audio Load Error: %s", e)
+                notify("Transcription Failed", str(e), critical=True)
+                continue
+            if audio is None:
+                fallback.append(i)
+            elif not len(audio):
+                logger.warning("Empty recording.")
+            elif len(audio) > MAX_SAMPLES:
+                solo.append((i, audio))
+            else:
+                batch.append(i)
+                lens.append(len(audio))
+
+        if not batch and not solo and not fallback:
+            return texts
+
+        model = None
         try:
-            if not shutil.which("wl-copy"): raise FileNotFoundError("wl-copy not found in PATH")
-            subprocess.run(["wl-copy"], input=text.encode('utf-8'), check=True)
-            notify("Transcription Complete", text)
+            model = self.get_model()
+            if batch:
+                width = max(lens)
+                for row, n in enumerate(lens):
+                    self._in_buf[row, n:width] = 0
+                results = model.asr.recognize_batch(self._in_buf[:len(batch), :width], np.array(lens, dtype=np.int64))
+                for i, res in zip(batch, results):
+                    texts[i] = res.text
+            for i, audio in solo:
+                # Equal pieces under the engine's profile limit, so no short tail falls below its minimum either
+                pieces = np.array_split(audio, -(-len(audio) // TRT_MAX_SAMPLES)) if self._trt_encoder else [audio]
+                texts[i] = " ".join(
+                    next(model.asr.recognize_batch(piece[None], np.array([len(piece)], dtype=np.int64))).text.strip()
+                    for piece in pieces
+                )
+            for i in fallback:
+                texts[i] = model.recognize(items[i])
+            return texts
         except Exception as e:
-            logger.error(f"Wayland Output Error: {e}")
-            notify("Output Failed (wl-copy)", str(e), critical=True)
+            logger.error("Inference Error: %s", e)
+            notify("Transcription Failed", str(e), critical=True)
+        # Outside the handler, where the traceback's frames no longer hold the sessions
+        model = None
+        self.unload_model()
+        return [None] * len(items)
 
     def start(self):
         signal.signal(signal.SIGTERM, lambda s, f: self.stop())
         signal.signal(signal.SIGINT, lambda s, f: self.stop())
         
         PID_FILE.write_text(str(os.getpid()))
-        if FIFO_PATH.exists() and not FIFO_PATH.is_fifo(): FIFO_PATH.unlink()
-        
-        self.fifo_reader.start()
+
+        # One thread, one selector: FIFO paths, socket PCM/WAV, the idle timer and signals all wake the same loop
+        fifo_fd = open_fifo(FIFO_PATH)
+        listener = open_unix_listener(SOCKET_PATH)
+        wav_listener = open_unix_listener(WAV_SOCKET_PATH)
+        timer_fd = os.timerfd_create(time.CLOCK_MONOTONIC, flags=os.TFD_NONBLOCK | os.TFD_CLOEXEC)
+        # select() is retried after a signal handler runs, so SIGTERM needs its own wakeup with no tick left
+        wake_r, wake_w = socket.socketpair()
+        wake_r.setblocking(False)
+        wake_w.setblocking(False)
+        signal.set_wakeup_fd(wake_w.fileno())
+        sel = selectors.DefaultSelector()
+        sel.register(fifo_fd, selectors.EVENT_READ, "fifo")
+        sel.register(listener, selectors.EVENT_READ, "pcm")
+        sel.register(wav_listener, selectors.EVENT_READ, "wav")
+        sel.register(timer_fd, selectors.EVENT_READ, "timer")
+        sel.register(wake_r, selectors.EVENT_READ, "signal")
+
         READY_FILE.touch()
-        logger.info(f"Daemon Ready (PID: {os.getpid()})")
+        logger.info("Daemon Ready (PID: %d)", os.getpid())
         
         try:
+            # Load while the user is still speaking; the first request then finds a warm model
+            try:
+                self.get_model()
+                self._preloaded_at = time.time()
+            except Exception as e: logger.error("Model Preload Error: %s", e)
+            self.arm_idle_timer(timer_fd)
+
             while self.running:
+                items = []
+                wav_fds = []
+                for key, _ in sel.select():
+                    if key.data == "signal":
+                        wake_r.recv(64)
+                    elif key.data == "timer":
+                        os.read(timer_fd, 8)
+                        self.check_idle()
+                        self.arm_idle_timer(timer_fd)
+                    elif key.data == "fifo":
+                        try: items.extend(p for p in read_fifo_paths(fifo_fd) if Path(p).exists())
+                        except OSError as e: logger.error("FIFO Read Error: %s", e)
+                    elif key.data in ("pcm", "wav"):
+                        conn, _ = key.fileobj.accept()
+                        conn.setblocking(False)
+                        stream = PcmStream(conn) if key.data == "pcm" else WavStream(conn)
+                        sel.register(conn, selectors.EVENT_READ, stream)
+                    elif isinstance(key.data, PcmStream):
+                        frames, still_open = key.data.feed()
+                        items.extend(frames)
+                        if not still_open:
+                            sel.unregister(key.fileobj)
+                            key.data.close()
+                    elif isinstance(key.data, WavStream):
+                        memfd, still_open = key.data.feed()
+                        if memfd is not None:
+                            wav_fds.append(memfd)
+                            items.append(f"/proc/self/fd/{memfd}")
+                        if not still_open:
+                            sel.unregister(key.fileobj)
+                            key.data.close()
+
+                # Everything that arrived together shares one encoder run
                 try:
-                    filepath = self.path_queue.get(timeout=1.0)
-                    if Path(filepath).exists():
-                        self.transcribe(filepath)
-                    self.path_queue.task_done()
-                except queue.Empty: 
-                    self.check_idle()
-        finally: self.cleanup()
+                    for i in range(0, len(items), QUEUE_SIZE):
+                        self.transcribe(items[i:i + QUEUE_SIZE])
+                finally:
+                    for memfd in wav_fds: os.close(memfd)
+                if items:
+                    self.arm_idle_timer(timer_fd)
+        finally:
+            for key in list(sel.get_map().values()):
+                if isinstance(key.data, (PcmStream, WavStream)):
+                    key.data.close()
+            sel.close()
+            listener.close()
+            wav_listener.close()
+            os.close(fifo_fd)
+            os.close(timer_fd)
+            signal.set_wakeup_fd(-1)
+            wake_r.close()
+            wake_w.close()
+            self.cleanup()
 
     def stop(self):
         self.running = False
@@ -236,8 +678,7 @@ class DuskySTTDaemon:
     def cleanup(self):
         logger.info("Shutting down...")
         self.running = False
-        self.fifo_reader.active = False
-        for p in (FIFO_PATH, PID_FILE, READY_FILE):
+        for p in (FIFO_PATH, SOCKET_PATH, WAV_SOCKET_PATH, PID_FILE, READY_FILE):
             try: p.unlink(missing_ok=True)
             except Exception: pass
 
@@ -36,7 +36,7 @@ cd "$ENV_DIR"
 uv init --python 3.14 --no-workspace 2>/dev/null || true
 
 echo ":: Installing Dependencies for $MODE..."
-uv add "onnx-asr" "soundfile" "numpy" "huggingface_hub" "hf-transfer"
+uv add "onnx-asr" "soundfile" "numpy" "huggingface_hub" "hf-transfer" "jeepney"
 
 case "$MODE" in
     nvidia) 
@@ -65,6 +65,8 @@ readonly APP_DIR="$HOME/contained_apps/uv/dusky_stt"
 readonly PID_FILE="/tmp/dusky_stt.pid"
 readonly READY_FILE="/tmp/dusky_stt.ready"
 readonly FIFO_PATH="/tmp/dusky_stt.fifo"
+readonly WAV_SOCKET="/tmp/dusky_stt_wav.sock"
+readonly PCM_SOCKET="/tmp/dusky_stt.sock"
 readonly DAEMON_LOG="/tmp/dusky_stt.log"
 readonly RECORD_PID_FILE="/tmp/dusky_stt_record.pid"
 
@@ -80,6 +82,18 @@ get_libs() {
     fi
 }
 
+# --stream: the recorder's wav goes straight down the daemon's WAV socket as it is captured, no file written.
+# splice() keeps the copy in-kernel; the daemon transcribes once the recorder exits and the pipe closes.
+stream_audio() {
+    python3 -c '
+import os, socket, sys
+with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+    s.connect(sys.argv[1])
+    while os.splice(0, s.fileno(), 1 << 16):
+        pass
+' "$WAV_SOCKET"
+}
+
 is_running() { [[ -f "$PID_FILE" ]] && kill -0 "$(cat "$PID_FILE" 2>/dev/null)" 2>/dev/null; }
 
 start_daemon() {
@@ -115,9 +129,14 @@ OPTIONS:
     --restart        Restart the daemon
     --status         Check if daemon is running
     --logs           Tail the daemon log
+    --stream         Toggle recording like the default, but stream it to the daemon instead of
+                     writing a wav to disk (needs arecord and python3)
+    --stdin          Transcribe up to 30 s of raw f32le 16 kHz mono PCM from stdin, e.g.
+                     ffmpeg -i clip.mp3 -f f32le -ac 1 -ar 16000 - | trigger.sh --stdin
 HELP
 }
 
+STREAM=0
 case "${1:-}" in
     --help|-h) show_help; exit 0 ;;
     --kill|--stop)
@@ -155,6 +174,22 @@ case "${1:-}" in
         fi
         exit 0
         ;;
+    --stdin)
+        is_running || start_daemon || { echo ":: Daemon startup failed."; exit 1; }
+        # One <u32 sample_count><f32 samples> frame over the daemon's PCM socket; no file is written
+        python3 -c '
+import socket, sys
+pcm = sys.stdin.buffer.read()
+count = len(pcm) // 4
+if not 0 < count <= 16000 * 30:
+    sys.exit(":: Expected up to 30 s of f32le 16 kHz mono PCM on stdin.")
+with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+    s.connect(sys.argv[1])
+    s.sendall(count.to_bytes(4, "little") + pcm[:count * 4])
+' "$PCM_SOCKET"
+        exit $?
+        ;;
+    --stream) STREAM=1 ;;
     "") ;;
     *) echo ":: Unknown flag: $1"; exit 1 ;;
 esac
@@ -167,14 +202,19 @@ if [[ -f "$RECORD_PID_FILE" ]] && kill -0 "$(cat "$RECORD_PID_FILE" 2>/dev/null)
     rm -f "$RECORD_PID_FILE"
     
     notify-send -a "Parakeet STT" -t 1500 "Processing..." "Transcribing to clipboard"
-    printf '%s\n' "$AUDIO_FILE" > "$FIFO_PATH" &
+    # A streamed recording is already with the daemon; only a file on disk needs its path sent
+    [[ -f "$AUDIO_FILE" ]] && printf '%s\n' "$AUDIO_FILE" > "$FIFO_PATH" &
 else
     if ! is_running; then
         start_daemon || { notify-send -u critical "STT Error" "Daemon startup failed"; exit 1; }
     fi
     
     mkdir -p "$AUDIO_DIR"
-    if command -v pw-record &>/dev/null; then
+    rm -f "$AUDIO_FILE"
+    if (( STREAM )) && [[ -S "$WAV_SOCKET" ]] && command -v arecord &>/dev/null && command -v python3 &>/dev/null; then
+        # Process substitution keeps $! on the recorder, so stopping it lets the forwarder drain and exit
+        arecord -q -t wav -f S16_LE -c 1 -r 16000 - > >(stream_audio) &
+    elif command -v pw-record &>/dev/null; then
         pw-record --target @DEFAULT_AUDIO_SOURCE@ --rate 16000 --channels 1 --format=s16 "$AUDIO_FILE" &
     else
         arecord -f S16_LE -c 1 -r 16000 "$AUDIO_FILE" &
@@ -10,6 +10,18 @@ from pathlib import Path
 from typing import Any, Never
 from urllib.error import URLError
 
+# orjson's C encoder when installed; stdlib json otherwise (orjson.JSONDecodeError subclasses json's)
+try:
+    import orjson
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    loads = orjson.loads
+except ImportError:
+    dumps = json.dumps
+    loads = json.loads
+
 # Consolidated WMO Codes: O(1) unified lookup for both icon and description
 WEATHER_CODES: dict[int, tuple[str, str]] = {
     0: ("", "Clear sky"),
@@ -42,6 +54,20 @@ WEATHER_CODES: dict[int, tuple[str, str]] = {
     99: ("", "Thunderstorm with heavy hail"),
 }
 
+UNKNOWN_WEATHER: tuple[str, str] = ("", "Unknown")
+
+# Icon/description baked in once per code; only the numbers are filled in per run via format_map
+_TOOLTIP_TEMPLATE = (
+    '\t\t<span size="xx-large">{{temp}}{{unit}}</span>\t\t\n'
+    '<big>{icon}</big>\n'
+    '<big>{desc}</big>\n'
+    ':{{temp_max}}{{unit}}  :{{temp_min}}{{unit}}  |  {{precip}}%'
+)
+TEMPLATE_BY_CODE: dict[int, tuple[str, str]] = {
+    code: (f"{icon}   {{temp}}{{unit}}", _TOOLTIP_TEMPLATE.format(icon=icon, desc=desc))
+    for code, (icon, desc) in (*WEATHER_CODES.items(), (-1, UNKNOWN_WEATHER))
+}
+
 IMPERIAL_COUNTRIES = {"US", "LR", "MM"}
 STATE_FILE = Path.home() / ".config" / "dusky" / "settings" / "waybar_weather"
 
@@ -53,7 +79,7 @@ def print_waybar_data(text: str, tooltip: str, alt: str = "Weather", css_class:
         "tooltip": tooltip,
         "class": css_class
     }
-    print(json.dumps(out), flush=True)
+    print(dumps(out), flush=True)
 
 def fail_gracefully(message: str, tooltip: str = "") -> Never:
     """Exits 0 to prevent Waybar from aggressively restarting the thread on network drops."""
@@ -65,7 +91,7 @@ def fetch_json(url: str, timeout: int = 5) -> dict[str, Any] | None:
     req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"})
     try:
         with urllib.request.urlopen(req, timeout=timeout) as response:
-            return json.loads(response.read())
+            return loads(response.read())
     except (URLError, json.JSONDecodeError, TimeoutError, http.client.HTTPException, OSError):
         return None
 
@@ -154,10 +180,10 @@ def main() -> None:
         stale_payload = read_state(ignore_ttl=True)
         if stale_payload:
             try:
-                stale_dict = json.loads(stale_payload)
+                stale_dict = loads(stale_payload)
                 stale_dict["class"] = ["weather", "offline"]
                 stale_dict["tooltip"] = stale_dict.get("tooltip", "") + "\n\n<span color='red'>⚠ System Offline - Showing Cached Data</span>"
-                print(json.dumps(stale_dict), flush=True)
+                print(dumps(stale_dict), flush=True)
                 sys.exit(0)
             except json.JSONDecodeError:
                 pass
@@ -189,24 +215,23 @@ def main() -> None:
         fail_gracefully("Parse Error", "Malformed response from Open-Meteo API.")
 
     # 7. Build Output
-    icon, weather_desc = WEATHER_CODES.get(weather_code, ("", "Unknown"))
-    temp_symbol = "°F" if unit == "imperial" else "°C"
-
-    tooltip_text = (
-        f'\t\t<span size="xx-large">{temp}{temp_symbol}</span>\t\t\n'
-        f'<big>{icon}</big>\n'
-        f'<big>{weather_desc}</big>\n'
-        f':{temp_max}{temp_symbol}  :{temp_min}{temp_symbol}  |  {precip_prob}%'
-    )
+    text_template, tooltip_template = TEMPLATE_BY_CODE.get(weather_code, TEMPLATE_BY_CODE[-1])
+    values = {
+        "temp": temp,
+        "temp_max": temp_max,
+        "temp_min": temp_min,
+        "precip": precip_prob,
+        "unit": "°F" if unit == "imperial" else "°C",
+    }
 
     final_payload = {
-        "text": f"{icon}   {temp}{temp_symbol}",
+        "text": text_template.format_map(values),
         "alt": city if city else "Weather",
-        "tooltip": tooltip_text,
+        "tooltip": tooltip_template.format_map(values),
         "class": "weather"
     }
     
-    final_json_string = json.dumps(final_payload)
+    final_json_string = dumps(final_payload)
     
     # Write directly to the state file, then execute print output
     write_state(final_json_string)